@@ -26,13 +26,27 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
 )
 
-from .const import CONF_MODBUS_ADDR, HVACPreset_AUTO
+from .const import (
+    COMMAND_DEBOUNCE,
+    CONF_MODBUS_ADDR,
+    DOMAIN,
+    HVACPreset_AUTO,
+    PARAMS_REFRESH_HOURS,
+    PARAMS_STORAGE_VERSION,
+    SCAN_FAST_WINDOW,
+    SCAN_IDLE_POLLS,
+    SCAN_INTERVAL_FAST,
+    SCAN_INTERVAL_IDLE,
+    SCAN_INTERVAL_NORMAL,
+)
 from .etathermmodbus import EtathermModbus
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,6 +55,16 @@ VERSION = "1.1.1"
 
 SUPPORT_FLAGS = 0
 
+# Required-temperature flag (0:summer, 1:HDO, 2:temporary, 3:permanent,
+# 4:scheduled) mapped to the HVAC mode it implies.
+_FLAG_TO_MODE = {
+    0: HVACMode.OFF,
+    1: HVACMode.AUTO,
+    2: HVACMode.HEAT,
+    3: HVACMode.HEAT,
+    4: HVACMode.AUTO,
+}
+
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
@@ -67,7 +91,27 @@ async def async_setup_platform(
 
     Etherm = EtathermModbus(host, port, modbus_id)
 
+    # Parameters only change when the installer reconfigures the device, so
+    # persist them and skip the startup register reads on warm restarts.
+    store = Store(hass, PARAMS_STORAGE_VERSION, f"{DOMAIN}_params_{host}_{modbus_id}")
+    stored = await store.async_load()
+    if stored is not None:
+        # JSON object keys come back as strings; positions are ints.
+        Etherm.preload_params({int(pos): p for pos, p in stored.items()})
+    elif await Etherm.async_refresh_parameters():
+        # Only persist parameters that were actually read from the device.
+        await store.async_save(Etherm.export_params())
+
     Params = await Etherm.get_parameters()
+
+    async def _refresh_params(now) -> None:
+        if await Etherm.async_refresh_parameters():
+            await store.async_save(Etherm.export_params())
+
+    async_track_time_interval(
+        hass, _refresh_params, timedelta(hours=PARAMS_REFRESH_HOURS)
+    )
+
     coordinator = EtathermCoordinator(hass, Etherm)
     _LOGGER.debug(Params)
 
@@ -89,24 +133,55 @@ class EtathermCoordinator(DataUpdateCoordinator):
             # Name of the data. For logging purposes.
             name="Etatherm",
             # Polling interval. Will only be polled if there are subscribers.
-            update_interval=timedelta(seconds=15),
+            update_interval=timedelta(seconds=SCAN_INTERVAL_NORMAL),
+            # Skip entity callbacks when the polled data is unchanged.
+            always_update=False,
         )
         self.etherm = etherm
+        self._last_command = None
+        self._unchanged_polls = 0
 
     async def setTemperature(self, pos, temperature) -> None:
         await self.etherm.set_temporary_temperature(pos, temperature, 120)
+        self.__note_command()
 
     async def setHVACMode(self, pos, hvac_mode) -> None:
         await self.etherm.set_mode(pos, hvac_mode == HVACMode.AUTO)
+        self.__note_command()
+
+    def __note_command(self) -> None:
+        """Poll quickly for a short while after a command was sent."""
+        self._last_command = self.hass.loop.time()
+        self._unchanged_polls = 0
+        self.update_interval = timedelta(seconds=SCAN_INTERVAL_FAST)
+        # Changing update_interval does not reschedule an already-armed
+        # refresh (which may be up to 60 s out when idle), so kick one now.
+        self.hass.async_create_task(self.async_request_refresh())
+
+    def __adapt_interval(self, data: dict) -> None:
+        """Pick the next polling interval based on recent activity."""
+        if (
+            self._last_command is not None
+            and self.hass.loop.time() - self._last_command < SCAN_FAST_WINDOW
+        ):
+            self.update_interval = timedelta(seconds=SCAN_INTERVAL_FAST)
+            return
+        if data == self.data:
+            self._unchanged_polls += 1
+        else:
+            self._unchanged_polls = 0
+        if self._unchanged_polls >= SCAN_IDLE_POLLS:
+            self.update_interval = timedelta(seconds=SCAN_INTERVAL_IDLE)
+        else:
+            self.update_interval = timedelta(seconds=SCAN_INTERVAL_NORMAL)
 
     async def __async_get_data(self) -> dict:
         async with asyncio.timeout(10):
             # Grab active context variables to limit data required to be fetched from API
-            # Note: using context is not required if there is no need or ability to limit
-            # data retrieved from API.
             listening_idx = set(self.async_contexts())
-            current = await self.etherm.get_current_temperatures()
-            required = await self.etherm.get_required_temperatures()
+            current, required = await self.etherm.get_current_and_required_temperatures(
+                listening_idx
+            )
             data = {
                 iid: {"curr": curr, "req": required[iid]}
                 for iid, curr in current.items()
@@ -124,7 +199,9 @@ class EtathermCoordinator(DataUpdateCoordinator):
         # try:
         # Note: asyncio.TimeoutError and aiohttp.ClientError are already
         # handled by the data update coordinator.
-        return await self.__async_get_data()
+        data = await self.__async_get_data()
+        self.__adapt_interval(data)
+        return data
 
 
 class EtathermThermostat(CoordinatorEntity, ClimateEntity):
@@ -132,6 +209,7 @@ class EtathermThermostat(CoordinatorEntity, ClimateEntity):
 
     coordinator: EtathermCoordinator
 
+    _attr_should_poll = False
     _attr_hvac_modes = [HVACMode.HEAT, HVACMode.AUTO]
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
@@ -143,10 +221,9 @@ class EtathermThermostat(CoordinatorEntity, ClimateEntity):
         super().__init__(coordinator, context=idx)
         self._id = idx
         self._attr_unique_id = uid
-        self._name = params["name"]
         self._attr_name = params["name"]
-        self._current_temperature = None
-        self._target_temperature = None
+        self._attr_current_temperature = None
+        self._attr_target_temperature = None
         self._attr_hvac_mode = HVACMode.AUTO
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         # self._attr_max_temp=
@@ -154,53 +231,78 @@ class EtathermThermostat(CoordinatorEntity, ClimateEntity):
         self._attr_preset_mode = HVACPreset_AUTO
         self._attr_target_temperature_high = params["max"]
         self._attr_target_temperature_low = params["min"]
-
-    @property
-    def name(self) -> str:
-        """Return the name of the thermostat."""
-        return self._name
-
-    @property
-    def current_temperature(self):
-        """Return the current temperature."""
-        return self._current_temperature
-
-    @property
-    def target_temperature(self):
-        """Return the temperature we try to reach."""
-        return self._target_temperature
+        self._pending_temp = None
+        self._temp_debounce = None
+        self._pending_mode = None
+        self._mode_debounce = None
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new mode."""
         if hvac_mode not in self._attr_hvac_modes:
             return
-        await self.coordinator.setHVACMode(self._id, hvac_mode)
+        self._pending_mode = hvac_mode
+        if self._mode_debounce is not None:
+            self._mode_debounce.cancel()
+        self._mode_debounce = self.hass.loop.call_later(
+            COMMAND_DEBOUNCE, self.__send_pending_mode
+        )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
-        self._target_temperature = int(temperature)
-        await self.coordinator.setTemperature(self._id, temperature)
+        self._attr_target_temperature = int(temperature)
+        self._pending_temp = temperature
+        if self._temp_debounce is not None:
+            self._temp_debounce.cancel()
+        self._temp_debounce = self.hass.loop.call_later(
+            COMMAND_DEBOUNCE, self.__send_pending_temperature
+        )
         if (hvac_mode := kwargs.get(ATTR_HVAC_MODE)) is not None:
-            await self.coordinator.setHVACMode(self._id, hvac_mode)
+            await self.async_set_hvac_mode(hvac_mode)
+
+    @callback
+    def __send_pending_temperature(self) -> None:
+        """Send the last debounced setpoint to the device."""
+        self._temp_debounce = None
+        temperature, self._pending_temp = self._pending_temp, None
+        self.hass.async_create_task(
+            self.coordinator.setTemperature(self._id, temperature)
+        )
+
+    @callback
+    def __send_pending_mode(self) -> None:
+        """Send the last debounced mode to the device."""
+        self._mode_debounce = None
+        hvac_mode, self._pending_mode = self._pending_mode, None
+        self.hass.async_create_task(self.coordinator.setHVACMode(self._id, hvac_mode))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel pending debounced commands."""
+        if self._temp_debounce is not None:
+            self._temp_debounce.cancel()
+            self._temp_debounce = None
+        if self._mode_debounce is not None:
+            self._mode_debounce.cancel()
+            self._mode_debounce = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data is not None:
-            self._current_temperature = self.coordinator.data[self._id]["curr"]
-            self._target_temperature = self.coordinator.data[self._id]["req"]["temp"]
-            if self._current_temperature < self._target_temperature:
-                self._attr_hvac_action = HVACAction.HEATING
-            else:
-                self._attr_hvac_action = HVACAction.IDLE
-            flag = self.coordinator.data[self._id]["req"]["flag"]
-            match flag:
-                case 0:
-                    self._attr_hvac_mode = HVACMode.OFF
-                case 1 | 4:
-                    self._attr_hvac_mode = HVACMode.AUTO
-                case 2 | 3:
-                    self._attr_hvac_mode = HVACMode.HEAT
-            self.async_write_ha_state()
+        if self.coordinator.data is None:
+            return
+        if (entry := self.coordinator.data.get(self._id)) is None:
+            # Position no longer reported, e.g. marked unused by a
+            # parameter refresh.
+            return
+        self._attr_current_temperature = entry["curr"]
+        self._attr_target_temperature = entry["req"]["temp"]
+        self._attr_hvac_action = (
+            HVACAction.HEATING
+            if self._attr_current_temperature < self._attr_target_temperature
+            else HVACAction.IDLE
+        )
+        self._attr_hvac_mode = _FLAG_TO_MODE.get(
+            entry["req"]["flag"], self._attr_hvac_mode
+        )
+        self.async_write_ha_state()
@@ -6,6 +6,18 @@ HVACPreset_AUTO = "auto"
 HVACPreset_KEEP = "keep"
 
 CONF_MODBUS_ADDR = "modbus_addr"
+
+SCAN_INTERVAL_FAST = 5
+SCAN_INTERVAL_NORMAL = 15
+SCAN_INTERVAL_IDLE = 60
+SCAN_FAST_WINDOW = 30
+SCAN_IDLE_POLLS = 8
+
+COMMAND_DEBOUNCE = 0.3
+
+PARAMS_STORAGE_VERSION = 1
+PARAMS_REFRESH_HOURS = 24
 CONF_MODBUS_RETR = 10
 CONF_MODBUS_RETR_WAIT = 1
+CONF_MODBUS_RETR_WAIT_MAX = 5
 CONF_MODBUS_TIMEOUT = 15
\ No newline at end of file
@@ -3,14 +3,53 @@
 from array import array
 import asyncio
 from datetime import datetime, timedelta
+import inspect
 import logging
 from math import floor
+import random
+import socket
+import sys
 
 from pymodbus.client import AsyncModbusTcpClient
+from pymodbus.exceptions import ModbusException
 from pymodbus.payload import BinaryPayloadBuilder, BinaryPayloadDecoder
-from .const import CONF_MODBUS_RETR, CONF_MODBUS_RETR_WAIT, CONF_MODBUS_TIMEOUT
+from pymodbus.pdu import ExceptionResponse
+from .const import (
+    CONF_MODBUS_RETR,
+    CONF_MODBUS_RETR_WAIT,
+    CONF_MODBUS_RETR_WAIT_MAX,
+    CONF_MODBUS_TIMEOUT,
+)
 _LOGGER = logging.getLogger(__name__)
 
+# Scale factors of the device "time of year" encoding: quarter-hours per
+# hour slot, per day and per month.
+_TOY_DAY = 32 * 4
+_TOY_MONTH = 32 * 32 * 4
+
+# Modbus FC03 caps a single read at 125 registers; the response byte-count
+# field is one byte, so larger reads cannot even be framed.
+_MAX_READ_REGISTERS = 125
+
+
+def _regs_to_bytes(regs) -> bytes:
+    """Return the payload byte of each 16-bit register.
+
+    The Etatherm gateway transports one data byte per register in the low
+    byte. Unlike ``bytes(regs)`` this does not raise when a high byte
+    happens to be set and converts without a per-element Python loop.
+    """
+    buf = array("H", regs)
+    if sys.byteorder == "big":
+        buf.byteswap()
+    return buf.tobytes()[::2]
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for Modbus retries."""
+    delay = min(CONF_MODBUS_RETR_WAIT_MAX, CONF_MODBUS_RETR_WAIT * 2**attempt)
+    return delay * (0.5 + random.random() * 0.5)
+
 
 class EtathermModbus:
     """Access to Etatherm climate control by Modbus protocol."""
@@ -21,14 +60,66 @@ class EtathermModbus:
         address,
     ):
         """Init method."""
-        self._client = AsyncModbusTcpClient(host=host, port=port, timeout= CONF_MODBUS_TIMEOUT)
+        # The connect/disconnect callback kwarg differs per pymodbus release:
+        # 3.7 has on_connect_callback, 3.8+ has trace_connect, older versions
+        # have neither (then connection state is polled per request).
+        client_params = inspect.signature(AsyncModbusTcpClient.__init__).parameters
+        if "on_connect_callback" in client_params:
+            connect_kwargs = {"on_connect_callback": self.__on_connection_change}
+        elif "trace_connect" in client_params:
+            connect_kwargs = {"trace_connect": self.__on_connection_change}
+        else:
+            connect_kwargs = {}
+        self._client = AsyncModbusTcpClient(
+            host=host,
+            port=port,
+            timeout=CONF_MODBUS_TIMEOUT,
+            **connect_kwargs,
+        )
+        self._has_connect_callback = bool(connect_kwargs)
+        self._connected = False
         self._address = address
         self._params = None
+        self._decode = None
+        self._params_ready = asyncio.Event()
+        self._params_lock = asyncio.Lock()
+        # Serializes read-modify-write command sequences; plain reads are
+        # multiplexed by Modbus TCP transaction IDs and need no lock.
         self._lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
+        self._inflight: dict[tuple[int, int], asyncio.Future] = {}
+
+    async def __ensure_params(self) -> None:
+        """Read position parameters once; concurrent callers share the result."""
+        if self._params_ready.is_set():
+            return
+        async with self._params_lock:
+            if not self._params_ready.is_set():
+                await self.__read_params()
+                self._params_ready.set()
+
+    def preload_params(self, params: dict[int, dict[str, any]]) -> None:
+        """Seed the parameter cache, e.g. from persisted storage."""
+        self._params = params
+        self._decode = [
+            (pos, p["shift"], p["step"]) for pos, p in params.items() if p["used"]
+        ]
+        self._params_ready.set()
+
+    def export_params(self) -> dict[int, dict[str, any]] | None:
+        """Return the raw parameter cache for persisting."""
+        return self._params
+
+    async def async_refresh_parameters(self) -> bool:
+        """Re-read the parameters from the device, replacing the cache on success."""
+        async with self._params_lock:
+            result = await self.__read_params()
+            self._params_ready.set()
+            return result
+
     async def get_parameters(self) -> dict[int, dict[str, str]] | None:
         """Read positions configuration parameters."""
-        if self._params is None:
-            await self.__read_params()
+        await self.__ensure_params()
         if self._params is None:
             return None
         return {
@@ -45,15 +136,16 @@ class EtathermModbus:
         """Set heating mode."""
         start = 0x1100
         addr = start + (pos - 1) * 0x10 + 0x03
-        response = await self.async_read_holding_registers(self._address, addr, 6)
-        if response.isError():
-            return False
-        data = bytes(response.registers)
-        if auto:
-            data = bytes([data[0] & 0xDF]) + b"\x10\x80\x10\x80"
-        else:
-            data = bytes([data[0] | 0x20]) + data[1:5]
-        response = await self.async_write_register(self._address, addr, data)
+        async with self._lock:
+            response = await self.async_read_holding_registers(self._address, addr, 6)
+            if response.isError():
+                return False
+            data = _regs_to_bytes(response.registers)
+            if auto:
+                regs = (data[0] & 0xDF, 0x10, 0x80, 0x10, 0x80)
+            else:
+                regs = (data[0] | 0x20, data[1], data[2], data[3], data[4])
+            response = await self.async_write_register(self._address, addr, regs)
         if response.isError():
             return False
         return True
@@ -65,24 +157,26 @@ class EtathermModbus:
         start = 0x1100
         addr = start + (pos - 1) * 0x10 + 0x03
 
-        if self._params is None:
-            await self.__read_params()
+        await self.__ensure_params()
         position = self._params[pos]
         temp = (floor(temperature) // position["step"] - position["shift"]) & 0x1F
 
-        response = await self.async_read_holding_registers(self._address, addr, 1)
-        if response.isError():
-            return False
-        data = bytes(response.registers)
-        now = datetime.now()
-        start = self.__get_toy(now - timedelta(minutes=0))
-        end = self.__get_toy(now + timedelta(minutes=duration + 1))
-        data = (
-            bytes([(data[0] & 0xC0) + temp])
-            + start.to_bytes(2, "big")
-            + end.to_bytes(2, "big")
-        )
-        response = await self.async_write_register(self._address, addr, data)
+        async with self._lock:
+            response = await self.async_read_holding_registers(self._address, addr, 1)
+            if response.isError():
+                return False
+            data = _regs_to_bytes(response.registers)
+            now = datetime.now()
+            start = self.__get_toy(now - timedelta(minutes=0))
+            end = self.__get_toy(now + timedelta(minutes=duration + 1))
+            regs = (
+                (data[0] & 0xC0) + temp,
+                start >> 8,
+                start & 0xFF,
+                end >> 8,
+                end & 0xFF,
+            )
+            response = await self.async_write_register(self._address, addr, regs)
         if response.isError():
             return False
         return True
@@ -90,60 +184,118 @@ class EtathermModbus:
     async def get_current_temperatures(self) -> dict[int, int] | None:
         """Read actual temperatures as measured on all positions."""
         response = await self.async_read_holding_registers(self._address, 0x60, 16)
-        data = bytes(response.registers)
-        if self._params is None:
-            await self.__read_params()
+        data = _regs_to_bytes(response.registers)
+        await self.__ensure_params()
         if data is None or len(data) != 16 or self._params is None:
             return None
-        res = {}
-        for pos in range(1, 17):
-            b = data[pos - 1]
-            position = self._params[pos]
-            if position["used"]:
-                res[pos] = (b + position["shift"]) * position["step"]
-        return res
+        return {
+            pos: (data[pos - 1] + shift) * step for pos, shift, step in self._decode
+        }
+
+    async def get_current_and_required_temperatures(
+        self, positions: set[int] | None = None
+    ) -> tuple[dict[int, int], dict[int, dict[str, any]]] | None:
+        """Read current and required temperatures in one request.
+
+        When ``positions`` is given, only the narrowest register window
+        covering those positions is read; the current and required blocks
+        are 0x10 registers apart, so a single read still spans both.
+        """
+        if positions:
+            low = min(positions) - 1
+            high = max(positions) - 1
+        else:
+            low = 0
+            high = 15
+        count = 0x10 + high - low + 1
+        response = await self.async_read_holding_registers(
+            self._address, 0x60 + low, count
+        )
+        data = _regs_to_bytes(response.registers)
+        await self.__ensure_params()
+        if data is None or len(data) != count or self._params is None:
+            return None
+        current = {}
+        required = {}
+        for pos, shift, step in self._decode:
+            if positions and pos not in positions:
+                continue
+            if not low <= pos - 1 <= high:
+                continue
+            req = data[0x10 + pos - 1 - low]
+            current[pos] = (data[pos - 1 - low] + shift) * step
+            required[pos] = {
+                "temp": ((req & 0x1F) + shift) * step,
+                "flag": req >> 5,
+            }
+        return current, required
 
     async def get_required_temperatures(self) -> dict[int, dict[str, any]] | None:
         """Returns "temp" - required temperature, "flag" - 0:summer, 1:HDO, 2:temporary temperature, 3:permanent temperature, 4:scheduled"""
         response = await self.async_read_holding_registers(self._address, 0x70, 16)
-        data = bytes(response.registers)
-        if self._params is None:
-            await self.__read_params()
+        data = _regs_to_bytes(response.registers)
+        await self.__ensure_params()
         if data is None or len(data) != 16 or self._params is None:
             return None
-        res = {}
-        for pos in range(1, 17):
-            b = data[pos - 1] & 0x1F
-            flag = data[pos - 1] >> 5
-            position = self._params[pos]
-            if position["used"]:
-                res[pos] = {
-                    "temp": (b + position["shift"]) * position["step"],
-                    "flag": flag,
-                }
-        return res
-
-    def __get_toy(self, time_in: datetime) -> int:
-        return (
-            (time_in.minute // 15)
-            + (time_in.hour * 4)
-            + (time_in.day * 32 * 4)
-            + (time_in.month * 32 * 32 * 4)
+        return {
+            pos: {
+                "temp": ((data[pos - 1] & 0x1F) + shift) * step,
+                "flag": data[pos - 1] >> 5,
+            }
+            for pos, shift, step in self._decode
+        }
+
+    @staticmethod
+    def __get_toy(time_in: datetime) -> int:
+        _, month, day, hour, minute, *_ = time_in.timetuple()
+        return (minute // 15) + (hour * 4) + (day * _TOY_DAY) + (month * _TOY_MONTH)
+
+    async def __read_block(self, address: int, count: int) -> bytes | None:
+        """Read a register block in chunks of at most 125 registers.
+
+        Returns the concatenated payload bytes, or None if any chunk failed.
+        """
+        responses = await asyncio.gather(
+            *(
+                self.async_read_holding_registers(
+                    self._address,
+                    address + offset,
+                    min(_MAX_READ_REGISTERS, count - offset),
+                )
+                for offset in range(0, count, _MAX_READ_REGISTERS)
+            )
         )
+        if any(response.isError() for response in responses):
+            return None
+        return b"".join(_regs_to_bytes(response.registers) for response in responses)
 
-    async def __read_params(self) -> None:
+    async def __read_params(self) -> bool:
         start = 0x1100
         name_start = 0x1030
         res = {}
-        for pos in range(1, 17):
-            addr = start + (pos - 1) * 0x10
-            param_response = await self.async_read_holding_registers(
-                self._address, addr, 4
+        try:
+            params_buf, names_buf = await asyncio.gather(
+                self.__read_block(start, 16 * 0x10),
+                self.__read_block(name_start, 16 * 8),
             )
-            if param_response.isError():
-                res[pos] = {"used": False, "name": "<timeout>", "shift": 5, "step": 1}
-                continue
-            params = bytes(param_response.registers)
+        except ModbusException as err:
+            # An unreachable device raises instead of returning an error
+            # response; treat it as the same read failure.
+            _LOGGER.warning("Etatherm parameter read failed: %s", err)
+            params_buf = names_buf = None
+        if params_buf is None:
+            # Keep previously known parameters over the failure fallback.
+            if self._params is None:
+                self._params = {
+                    pos: {"used": False, "name": "<timeout>", "shift": 5, "step": 1}
+                    for pos in range(1, 17)
+                }
+                self._decode = []
+            return False
+        if names_buf is None:
+            names_buf = bytes(16 * 8)
+        for pos in range(1, 17):
+            params = params_buf[(pos - 1) * 0x10 : (pos - 1) * 0x10 + 4]
             used = params[0] & 0x07
             used = used != 0
             shift = params[2] & 0x3F
@@ -151,14 +303,7 @@ class EtathermModbus:
             step = (params[2] & 0xC0) >> 6
             step = step + 1
             if used:
-                addr = name_start + (pos - 1) * 8
-                name_response = await self.async_read_holding_registers(
-                    self._address, addr, 8
-                )
-                if param_response.isError():
-                    name = b""
-                else:
-                    name = bytes(name_response.registers)
+                name = names_buf[(pos - 1) * 8 : pos * 8]
                 end = name.find(b"\x00")
                 if end != -1:
                     name = name[:end]
@@ -167,17 +312,40 @@ class EtathermModbus:
                 name = ""
             res[pos] = {"used": used, "name": name, "shift": shift, "step": step}
         self._params = res
+        # Decode table for the polling hot path: (pos, shift, step) of used
+        # positions only, so each poll skips the per-position dict lookups.
+        self._decode = [
+            (pos, p["shift"], p["step"]) for pos, p in res.items() if p["used"]
+        ]
+        return True
 
     async def __async_close(self):
         """Disconnect client."""
         if self._client.connected:
             self._client.close()
 
+    def __on_connection_change(self, connected: bool) -> None:
+        """Track transport state pushed by pymodbus instead of polling it."""
+        self._connected = connected
+        if connected:
+            # pymodbus reconnects on its own; tune every new transport,
+            # not just the ones made through __async_connect.
+            self.__tune_socket()
+        else:
+            _LOGGER.info("Etatherm connection lost")
+
+    def __connection_ok(self) -> bool:
+        """Current connection state, pushed or polled depending on pymodbus."""
+        if self._has_connect_callback:
+            return self._connected
+        return self._client.connected
+
     async def __check_connection(self):
-        if not self._client.connected:
+        async with self._connect_lock:
+            if self.__connection_ok():
+                return True
             _LOGGER.info("Etatherm is not connected, trying to connect.")
             return await self.__async_connect()
-        return self._client.connected
 
     async def __async_connect(self):
         result = False
@@ -189,8 +357,10 @@ class EtathermModbus:
         )
 
         result = await self._client.connect()
+        self._connected = result
 
         if result:
+            self.__tune_socket()
             _LOGGER.info(
                 "Etatherm connected at %s:%s",
                 self._client.comm_params.host,
@@ -204,28 +374,80 @@ class EtathermModbus:
             )
         return result
 
+    def __tune_socket(self) -> None:
+        """Disable Nagle's algorithm and enable keepalive on the TCP socket."""
+        transport = getattr(self._client, "transport", None)
+        if transport is None:
+            return
+        sock = transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError as err:
+            _LOGGER.debug("Could not set socket options on Etatherm connection: %s", err)
+
     async def async_read_holding_registers(self, unit, address, count):
-        """Read holding registers."""
+        """Read holding registers, merging identical concurrent requests."""
+        key = (address, count)
+        if (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await inflight
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # Only the request owner was cancelled, not this caller;
+                # fall through and issue the read ourselves.
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await self.__do_read_holding_registers(unit, address, count)
+        except asyncio.CancelledError:
+            # Don't forward our own cancellation to waiters as theirs;
+            # cancelling the future lets them retry on their own.
+            fut.cancel()
+            raise
+        except BaseException as err:
+            fut.set_exception(err)
+            fut.exception()  # mark retrieved in case nobody else is waiting
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def __do_read_holding_registers(self, unit, address, count):
         kwargs = {"slave": unit} if unit else {}
-        async with self._lock:
+        if not self.__connection_ok():
             await self.__check_connection()
-            for i in range (0, CONF_MODBUS_RETR):
-                regs_l = await self._client.read_holding_registers(address, count=count, **kwargs)
-                if regs_l.isError():
-                    await asyncio.sleep(CONF_MODBUS_RETR_WAIT)			
-                else:
-                    break
-            return regs_l
-
-    async def async_write_register(self, unit, address, payload: bytes):
+        for i in range (0, CONF_MODBUS_RETR):
+            regs_l = await self._client.read_holding_registers(address, count=count, **kwargs)
+            if not regs_l.isError():
+                break
+            if isinstance(regs_l, ExceptionResponse) and regs_l.exception_code:
+                # A genuine device exception reply (illegal address/value);
+                # retrying won't help. Timeouts synthesized by pymodbus as
+                # ExceptionResponse carry no exception code and are retried.
+                break
+            await asyncio.sleep(_retry_delay(i))
+        return regs_l
+
+    async def async_write_register(self, unit, address, registers):
+        """Write register values (one payload byte per register)."""
         kwargs = {"slave": unit} if unit else {}
 
-        async with self._lock:
+        if not self.__connection_ok():
             await self.__check_connection()
-            for i in range (0, CONF_MODBUS_RETR):
-                regs_l = await self._client.write_registers(address, list(payload), **kwargs)
-                if regs_l.isError():
-                    await asyncio.sleep(CONF_MODBUS_RETR_WAIT)			
-                else:
-                    break
-            return regs_l
+        for i in range (0, CONF_MODBUS_RETR):
+            regs_l = await self._client.write_registers(address, registers, **kwargs)
+            if not regs_l.isError():
+                break
+            if isinstance(regs_l, ExceptionResponse) and regs_l.exception_code:
+                # A genuine device exception reply (illegal address/value);
+                # retrying won't help. Timeouts synthesized by pymodbus as
+                # ExceptionResponse carry no exception code and are retried.
+                break
+            await asyncio.sleep(_retry_delay(i))
+        return regs_l